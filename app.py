@@ -1,9 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import html
 import re
 import io
 from typing import List, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
 # Page configuration
@@ -61,165 +67,393 @@ with st.sidebar:
     encoding_option = st.selectbox("File encoding", ["utf-8", "latin-1", "cp1252"], help="Choose encoding if you have issues loading the CSV")
     delimiter_option = st.selectbox("CSV delimiter", [",", ";", "\t", "|"], help="CSV field separator")
 
-# Caching functions for better performance
+# Precompiled regular expressions used by the cleaning helpers
+_TAG_RE = re.compile(r'<[^>]*>')
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]*')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Whitespace runs, the per-value helpers use ' '.join(text.split()) which
+# matches the same characters without going through the regex engine
+_WS_RE = re.compile(r'\s+')
+
+# Alternatives fused into a single removal pass, in priority order
+_REMOVAL_ALTERNATIVES = {
+    'remove_tags': (_COMMENT_RE.pattern, _TAG_RE.pattern),
+    'remove_urls': (_URL_RE.pattern,),
+    'remove_email': (_EMAIL_RE.pattern,),
+}
+
+# Formatting tags and their markdown replacements for preserve_formatting
+_FORMATTING_RES = [
+    (re.compile(r'<strong[^>]*>(.*?)</strong>', re.IGNORECASE | re.DOTALL), r'**\1**'),
+    (re.compile(r'<b[^>]*>(.*?)</b>', re.IGNORECASE | re.DOTALL), r'**\1**'),
+    (re.compile(r'<em[^>]*>(.*?)</em>', re.IGNORECASE | re.DOTALL), r'*\1*'),
+    (re.compile(r'<i[^>]*>(.*?)</i>', re.IGNORECASE | re.DOTALL), r'*\1*'),
+    (re.compile(r'<h[1-6][^>]*>(.*?)</h[1-6]>', re.IGNORECASE | re.DOTALL), r'**\1**'),
+]
+
+# Leftover artifacts removed by strip_remaining_artifacts, applied in order
+_WP_COMMENT_RE = re.compile(r'<!-- wp:.*? -->')
+_SHORTCODE_RE = re.compile(r'\[.*?\]')
+_ARTIFACT_ENTITY_RES = [
+    (re.compile(r'&nbsp;'), ' '),
+    (re.compile(r'&amp;'), '&'),
+    (re.compile(r'&lt;'), '<'),
+    (re.compile(r'&gt;'), '>'),
+    (re.compile(r'&quot;'), '"'),
+    (re.compile(r'&#039;'), "'"),
+    (re.compile(r'&apos;'), "'"),
+]
+_ARTIFACT_ATTRIBUTE_RES = [
+    re.compile(r'class="[^"]*"'),
+    re.compile(r'style="[^"]*"'),
+    re.compile(r'target="_blank"'),
+    re.compile(r'rel="[^"]*"'),
+]
+
+# Entity reference scanner (same grammar as html.unescape) and the entities
+# common in blog exports, resolved without going through html.unescape
+_ENTITY_RE = re.compile(r'&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)')
+_COMMON_ENTITIES = {
+    'amp;': '&',
+    'lt;': '<',
+    'gt;': '>',
+    'quot;': '"',
+    'apos;': "'",
+    'nbsp;': '\xa0',
+    '#39;': "'",
+    '#039;': "'",
+    '#34;': '"',
+    '#38;': '&',
+    '#160;': '\xa0',
+}
+
+# Characters matched by Python's \s, spelled out for Arrow's RE2 engine whose
+# \s only covers ASCII whitespace
+_WHITESPACE_CHARS = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# Record separator used to join a column into one string for bulk decoding
+_COLUMN_SEPARATOR = "\x1e"
+
+# pandas' default missing-value strings, Arrow's own list lacks the last two
+_CSV_NULL_VALUES = pa_csv.ConvertOptions().null_values + ["<NA>", "None"]
+
+def read_csv_arrow(file_content: bytes, delimiter: str = ",") -> Optional[pd.DataFrame]:
+    """Read UTF-8 CSV into Arrow string columns, or None if the C engine should handle it."""
+    # The C engine reads just the header so empty and duplicate names match (Unnamed: 1, a.1)
+    columns = pd.read_csv(io.BytesIO(file_content), delimiter=delimiter, nrows=0).columns
+    
+    # Every column stays text, inference would rewrite values like 0x1A or +5 on export
+    try:
+        table = pa_csv.read_csv(
+            io.BytesIO(file_content),
+            read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={f"f{i}": pa.string() for i in range(len(columns))},
+                null_values=_CSV_NULL_VALUES,
+                strings_can_be_null=True
+            )
+        )
+    except pa.ArrowInvalid:
+        # Ragged rows and undecodable bytes, which the C engine pads or reports
+        return None
+    
+    if table.num_columns != len(columns):
+        return None
+    # The header came back as the first row
+    table = table.slice(1).rename_columns([str(col) for col in columns])
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+# Cached loader, the per-row text helpers below are cheaper than a cache lookup
 @st.cache_data(show_spinner="Loading CSV file...", ttl=300)
 def load_csv_file(file_content: bytes, encoding: str = "utf-8", delimiter: str = ",") -> pd.DataFrame:
     """Load CSV file with error handling and encoding options."""
     try:
-        return pd.read_csv(io.BytesIO(file_content), encoding=encoding, delimiter=delimiter)
+        # Arrow's CSV reader only decodes UTF-8 natively
+        if encoding == "utf-8":
+            df = read_csv_arrow(file_content, delimiter)
+            if df is not None:
+                return df
+        return pd.read_csv(io.BytesIO(file_content), encoding=encoding, delimiter=delimiter, dtype=pd.ArrowDtype(pa.string()))
     except UnicodeDecodeError:
         st.warning(f"Failed to decode with {encoding}, trying latin-1...")
-        return pd.read_csv(io.BytesIO(file_content), encoding="latin-1", delimiter=delimiter)
+        return pd.read_csv(io.BytesIO(file_content), encoding="latin-1", delimiter=delimiter, dtype=pd.ArrowDtype(pa.string()))
     except Exception as e:
         st.error(f"Error loading CSV: {str(e)}")
         return None
 
-@st.cache_data(show_spinner=False)
-def decode_html_entities(text: str) -> str:
-    """Decode HTML entities in text with multiple passes for nested encoding."""
-    if pd.isna(text) or text == "":
-        return ""
-    
-    text = str(text)
+@lru_cache(maxsize=4096)
+def _decode_entity(name: str) -> str:
+    """Decode one entity reference (without the leading '&'), cached per distinct token."""
+    return html.unescape('&' + name)
+
+def _replace_entity(match: re.Match) -> str:
+    name = match.group(1)
+    return _COMMON_ENTITIES.get(name) or _decode_entity(name)
+
+def fast_unescape(text: str) -> str:
+    """Drop-in replacement for html.unescape specialized for common entities."""
+    if '&' not in text:
+        return text
+    return _ENTITY_RE.sub(_replace_entity, text)
+
+def unescape_nested(text: str) -> str:
+    """Decode HTML entities in a string, repeating for nested encoding."""
     # Multiple passes to handle nested HTML encoding
     for _ in range(3):  # Usually 2-3 passes are enough
         original_text = text
-        text = html.unescape(text)
+        text = fast_unescape(text)
         if text == original_text:  # No more changes
             break
     
     return text
 
-@st.cache_data(show_spinner=False)
-def remove_html_tags(text: str, preserve_formatting: bool = False) -> str:
-    """Remove HTML tags with option to preserve formatting."""
-    if pd.isna(text) or text == "":
-        return ""
-    
-    text = str(text)
-    
-    if preserve_formatting:
-        # Replace formatting tags with markdown equivalents before removing
-        text = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', text, flags=re.IGNORECASE | re.DOTALL)
-        text = re.sub(r'<h[1-6][^>]*>(.*?)</h[1-6]>', r'**\1**', text, flags=re.IGNORECASE | re.DOTALL)
-    
-    # Remove all HTML tags (including those with attributes)
-    text = re.sub(r'<[^>]*>', '', text)
-    
-    # Clean up any remaining HTML comments
-    text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
-    
-    return text
+def is_arrow_string(series: pd.Series) -> bool:
+    """Check whether a column holds Arrow-backed strings."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_string(dtype.pyarrow_dtype) or pa.types.is_large_string(dtype.pyarrow_dtype)
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
 
-@st.cache_data(show_spinner=False)
-def normalize_whitespace_func(text: str) -> str:
-    """Normalize whitespace in text."""
-    if pd.isna(text) or text == "":
-        return ""
-    
-    text = str(text)
-    # Replace multiple whitespace characters with single space
-    text = re.sub(r'\s+', ' ', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    return text
+def unescape_values(values) -> list:
+    """Decode HTML entities for many strings with a single unescape call per pass."""
+    joined = _COLUMN_SEPARATOR.join(values)
+    
+    if joined.count(_COLUMN_SEPARATOR) != max(len(values) - 1, 0):
+        # Separator already present in the data, fall back to per-value decoding
+        return [unescape_nested(value) for value in values]
+    
+    # Multiple passes to handle nested HTML encoding, same as unescape_nested
+    for _ in range(3):
+        original_joined = joined
+        joined = fast_unescape(joined)
+        if joined == original_joined:
+            break
+    return joined.split(_COLUMN_SEPARATOR) if len(values) else []
 
-@st.cache_data(show_spinner=False)
-def remove_urls_func(text: str) -> str:
-    """Remove URLs from text."""
-    if pd.isna(text) or text == "":
-        return ""
-    
-    text = str(text)
-    # Remove HTTP/HTTPS URLs
-    text = re.sub(r'https?://[^\s<>"{}|\\^`\[\]]*', '', text)
-    return text
+def decode_html_arrow(series: pd.Series) -> pd.Series:
+    """Decode HTML entities in an Arrow string column, skipping rows without '&'."""
+    decoded = series.fillna("")
+    pending = np.flatnonzero(decoded.str.contains('&', regex=False).to_numpy(dtype=bool))
+    if len(pending):
+        decoded.iloc[pending] = unescape_values(decoded.iloc[pending].to_numpy())
+    return decoded
 
-@st.cache_data(show_spinner=False)
-def remove_email_func(text: str) -> str:
-    """Remove email addresses from text."""
-    if pd.isna(text) or text == "":
-        return ""
+def decode_html_column(series: pd.Series) -> pd.Series:
+    """Decode HTML entities for a whole column with a single unescape call per pass."""
+    if is_arrow_string(series):
+        return decode_html_arrow(series)
+    
+    mask = series.notna()
+    decoded = unescape_values(series[mask].astype(str).to_numpy())
     
-    text = str(text)
-    # Remove email addresses
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text)
+    result = pd.Series("", index=series.index, dtype=object)
+    result[mask] = decoded
+    return result
+
+def convert_formatting_tags(text: str) -> str:
+    """Replace formatting tags with markdown equivalents."""
+    for pattern, replacement in _FORMATTING_RES:
+        text = pattern.sub(replacement, text)
     return text
 
-def clean_text_comprehensive(text: str, options: dict) -> str:
-    """Apply all cleaning operations to text based on options."""
-    if pd.isna(text) or text == "":
-        return ""
-    
-    cleaned_text = str(text)
+@lru_cache(maxsize=None)
+def get_removal_pattern(remove_tags: bool, remove_urls: bool, remove_email: bool) -> Optional[re.Pattern]:
+    """Build a single alternation regex for the enabled removal options."""
+    enabled = {'remove_tags': remove_tags, 'remove_urls': remove_urls, 'remove_email': remove_email}
+    alternatives = [
+        pattern
+        for option, patterns in _REMOVAL_ALTERNATIVES.items() if enabled[option]
+        for pattern in patterns
+    ]
+    if not alternatives:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in alternatives), re.DOTALL)
+
+def clean_text_value(text: str, options: dict) -> str:
+    """Apply all cleaning operations to a non-empty string based on options."""
+    cleaned_text = text
     
     # Apply cleaning operations in optimal order
     if options.get('decode_html', True):
-        cleaned_text = decode_html_entities(cleaned_text)
+        cleaned_text = unescape_nested(cleaned_text)
     
-    if options.get('remove_tags', False):
-        cleaned_text = remove_html_tags(cleaned_text, options.get('preserve_formatting', False))
+    if options.get('remove_tags', False) and options.get('preserve_formatting', False):
+        cleaned_text = convert_formatting_tags(cleaned_text)
     
-    if options.get('remove_urls', False):
-        cleaned_text = remove_urls_func(cleaned_text)
-    
-    if options.get('remove_email', False):
-        cleaned_text = remove_email_func(cleaned_text)
+    # Remove tags, URLs and emails in one pass over the text
+    removal_re = get_removal_pattern(
+        options.get('remove_tags', False),
+        options.get('remove_urls', False),
+        options.get('remove_email', False)
+    )
+    if removal_re is not None:
+        cleaned_text = removal_re.sub('', cleaned_text)
     
     if options.get('normalize_whitespace', True):
-        cleaned_text = normalize_whitespace_func(cleaned_text)
+        cleaned_text = ' '.join(cleaned_text.split())
     
     # Final cleanup pass to remove any remaining artifacts
-    cleaned_text = clean_remaining_artifacts(cleaned_text)
+    cleaned_text = strip_remaining_artifacts(cleaned_text)
     
     return cleaned_text
 
-@st.cache_data(show_spinner=False)
-def clean_remaining_artifacts(text: str) -> str:
-    """Clean up any remaining HTML artifacts and formatting issues."""
-    if pd.isna(text) or text == "":
-        return ""
+def to_re2_pattern(pattern: re.Pattern) -> str:
+    """Translate a compiled pattern to the equivalent RE2 pattern used by Arrow kernels."""
+    source = pattern.pattern
+    translated = []
+    in_class = False
+    i = 0
+    
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            escape = source[i:i + 2]
+            if escape == r'\s':
+                # Spell out Python's Unicode whitespace, inside or outside a class
+                translated.append(_WHITESPACE_CHARS if in_class else f'[{_WHITESPACE_CHARS}]')
+            elif escape in (r'\S', r'\w', r'\W', r'\d', r'\D', r'\b', r'\B'):
+                raise ValueError(f"{escape} is ASCII-only in RE2, cannot translate {source!r}")
+            else:
+                translated.append(escape)
+            i += 2
+            continue
+        
+        translated.append(char)
+        i += 1
+        if char == '[' and not in_class:
+            in_class = True
+            # A leading '^' negates, and a ']' right after it is a literal
+            for literal in ('^', ']'):
+                if source[i:i + 1] == literal:
+                    translated.append(literal)
+                    i += 1
+        elif char == ']' and in_class:
+            in_class = False
+    
+    source = ''.join(translated)
+    flags = ''.join(flag for flag, bit in (('i', re.IGNORECASE), ('s', re.DOTALL)) if pattern.flags & bit)
+    return f'(?{flags}){source}' if flags else source
+
+def clean_arrow_column(series: pd.Series, options: dict) -> pd.Series:
+    """Apply all cleaning operations to an Arrow string column with Arrow regex kernels."""
+    if options.get('decode_html', True):
+        cleaned = decode_html_arrow(series)
+    else:
+        cleaned = series.fillna("")
+    
+    if options.get('remove_tags', False) and options.get('preserve_formatting', False):
+        for pattern, replacement in _FORMATTING_RES:
+            cleaned = cleaned.str.replace(to_re2_pattern(pattern), replacement, regex=True)
+    
+    # Remove tags, URLs and emails in one pass over the column
+    removal_re = get_removal_pattern(
+        options.get('remove_tags', False),
+        options.get('remove_urls', False),
+        options.get('remove_email', False)
+    )
+    if removal_re is not None:
+        try:
+            cleaned = cleaned.str.replace(to_re2_pattern(removal_re), '', regex=True)
+        except ValueError:
+            # The email pattern's \b has no RE2 equivalent, run the pass on Python's re
+            cleaned = pd.Series(
+                [removal_re.sub('', value) for value in cleaned],
+                index=cleaned.index,
+                dtype=cleaned.dtype
+            )
+    
+    if options.get('normalize_whitespace', True):
+        cleaned = cleaned.str.replace(to_re2_pattern(_WS_RE), ' ', regex=True).str.strip(' ')
+    
+    # Final cleanup pass, same steps as strip_remaining_artifacts
+    cleaned = cleaned.str.replace(to_re2_pattern(_WP_COMMENT_RE), '', regex=True)
+    cleaned = cleaned.str.replace(to_re2_pattern(_SHORTCODE_RE), '', regex=True)
+    for pattern, replacement in _ARTIFACT_ENTITY_RES:
+        cleaned = cleaned.str.replace(pattern.pattern, replacement, regex=False)
+    for pattern in _ARTIFACT_ATTRIBUTE_RES:
+        cleaned = cleaned.str.replace(to_re2_pattern(pattern), '', regex=True)
+    cleaned = cleaned.str.replace(to_re2_pattern(_WS_RE), ' ', regex=True).str.strip(' ')
+    
+    return cleaned
+
+def clean_column(series: pd.Series, options: dict) -> pd.Series:
+    """Apply all cleaning operations to a column, decoding HTML entities column-wide."""
+    if is_arrow_string(series):
+        return clean_arrow_column(series, options)
+    
+    if options.get('decode_html', True):
+        series = decode_html_column(series)
+    
+    # Missing and empty values are resolved once here instead of per row
+    mask = series.notna().to_numpy(copy=True)
+    mask[mask] = (series[mask] != "").to_numpy(dtype=bool)
     
-    text = str(text)
+    row_options = {**options, 'decode_html': False}
+    cleaned = [clean_text_value(str(value), row_options) for value in series[mask]]
     
+    result = pd.Series("", index=series.index, dtype=object)
+    result[mask] = cleaned
+    # Arrow-backed like the loaded columns, so display and export skip a conversion
+    return result.astype(pd.ArrowDtype(pa.string()))
+
+def strip_remaining_artifacts(text: str) -> str:
+    """Remove leftover HTML artifacts from a non-empty string."""
     # Remove WordPress comments and shortcodes
-    text = re.sub(r'<!-- wp:.*? -->', '', text)
-    text = re.sub(r'\[.*?\]', '', text)  # Remove shortcodes like [wp:paragraph]
+    text = _WP_COMMENT_RE.sub('', text)
+    text = _SHORTCODE_RE.sub('', text)  # Remove shortcodes like [wp:paragraph]
     
     # Clean up common HTML entities that might be missed
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'&amp;', '&', text)
-    text = re.sub(r'&lt;', '<', text)
-    text = re.sub(r'&gt;', '>', text)
-    text = re.sub(r'&quot;', '"', text)
-    text = re.sub(r'&#039;', "'", text)
-    text = re.sub(r'&apos;', "'", text)
+    for pattern, replacement in _ARTIFACT_ENTITY_RES:
+        text = pattern.sub(replacement, text)
     
     # Remove CSS class names and inline styles that might remain
-    text = re.sub(r'class="[^"]*"', '', text)
-    text = re.sub(r'style="[^"]*"', '', text)
-    text = re.sub(r'target="_blank"', '', text)
-    text = re.sub(r'rel="[^"]*"', '', text)
+    for pattern in _ARTIFACT_ATTRIBUTE_RES:
+        text = pattern.sub('', text)
     
     # Clean up multiple spaces and line breaks
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    text = ' '.join(text.split())
     
     return text
 
+def clean_and_measure_column(series: pd.Series, options: dict) -> tuple:
+    """Clean a column and calculate its cleaning statistics."""
+    cleaned_series = clean_column(series, options)
+    return cleaned_series, get_cleaning_stats(series, cleaned_series)
+
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to UTF-8 CSV bytes without an intermediate str."""
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+def dataframe_to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to zstd-compressed Parquet bytes."""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False, compression='zstd')
+    return buffer.getvalue()
+
+def to_arrow_strings(series: pd.Series) -> pa.ChunkedArray:
+    """Return column values as an Arrow string array, keeping missing values as nulls."""
+    if is_arrow_string(series):
+        return pa.chunked_array(pa.array(series))
+    values = series.astype(str).to_numpy(dtype=object)
+    return pa.chunked_array([pa.array(values, type=pa.string(), mask=series.isna().to_numpy())])
+
 def get_cleaning_stats(original_series: pd.Series, cleaned_series: pd.Series) -> dict:
     """Calculate statistics about the cleaning process."""
+    original = to_arrow_strings(original_series)
+    cleaned = to_arrow_strings(cleaned_series)
+    
     stats = {
         'total_rows': len(original_series),
-        'empty_original': original_series.isna().sum() + (original_series == "").sum(),
-        'empty_cleaned': cleaned_series.isna().sum() + (cleaned_series == "").sum(),
-        'avg_length_original': original_series.astype(str).str.len().mean(),
-        'avg_length_cleaned': cleaned_series.astype(str).str.len().mean(),
-        'html_entities_found': original_series.astype(str).str.contains('&[a-zA-Z]+;|&#\d+;').sum(),
-        'html_tags_found': original_series.astype(str).str.contains('<[^>]*>').sum()
+        'empty_original': original.null_count + (pc.sum(pc.equal(original, "")).as_py() or 0),
+        'empty_cleaned': cleaned.null_count + (pc.sum(pc.equal(cleaned, "")).as_py() or 0),
+        'avg_length_original': pc.mean(pc.fill_null(pc.utf8_length(original), 0)).as_py() or 0.0,
+        'avg_length_cleaned': pc.mean(pc.fill_null(pc.utf8_length(cleaned), 0)).as_py() or 0.0,
+        'html_entities_found': pc.sum(pc.match_substring_regex(original, r'&[a-zA-Z]+;|&#\d+;')).as_py() or 0,
+        'html_tags_found': pc.sum(pc.match_substring_regex(original, r'<[^>]*>')).as_py() or 0
     }
     
     stats['size_reduction'] = ((stats['avg_length_original'] - stats['avg_length_cleaned']) / stats['avg_length_original'] * 100) if stats['avg_length_original'] > 0 else 0
@@ -292,7 +526,7 @@ if uploaded_file is not None:
             
             # Show original data
             with st.expander("📄 Original Data Sample", expanded=True):
-                st.dataframe(df[columns_to_clean].head(preview_rows), use_container_width=True)
+                st.dataframe(df.head(preview_rows)[columns_to_clean], use_container_width=True)
         
         # Cleaning process
         if columns_to_clean and st.button("🚀 Start Cleaning Process", type="primary"):
@@ -316,27 +550,31 @@ if uploaded_file is not None:
             # Process each column
             all_stats = {}
             
-            for i, column in enumerate(columns_to_clean):
-                status_text.text(f"Cleaning column: {column}")
-                
-                # Apply cleaning
-                original_series = df[column].copy()
-                
-                with st.spinner(f"Processing {column}..."):
-                    cleaned_series = original_series.apply(
-                        lambda x: clean_text_comprehensive(x, cleaning_options)
-                    )
-                
-                # Add cleaned column to dataframe
+            results = {}
+            
+            status_text.text(f"Cleaning {len(columns_to_clean)} column(s)...")
+            
+            # Columns are cleaned in parallel, Arrow kernels release the GIL.
+            # clean_column never modifies its input so no copy is needed
+            with st.spinner("Processing columns..."):
+                with ThreadPoolExecutor(max_workers=min(8, len(columns_to_clean))) as executor:
+                    futures = {
+                        executor.submit(clean_and_measure_column, df[column], cleaning_options): column
+                        for column in columns_to_clean
+                    }
+                    for i, future in enumerate(as_completed(futures)):
+                        column = futures[future]
+                        results[column] = future.result()
+                        status_text.text(f"Cleaned column: {column}")
+                        
+                        # Update progress
+                        progress_bar.progress((i + 1) / len(columns_to_clean))
+            
+            # Add cleaned columns to dataframe in selection order
+            for column in columns_to_clean:
+                cleaned_series, all_stats[column] = results[column]
                 new_column_name = f"{column}{add_suffix}"
                 df[new_column_name] = cleaned_series
-                
-                # Calculate stats
-                column_stats = get_cleaning_stats(original_series, cleaned_series)
-                all_stats[column] = column_stats
-                
-                # Update progress
-                progress_bar.progress((i + 1) / len(columns_to_clean))
             
             status_text.text("✅ Cleaning completed!")
             progress_bar.progress(1.0)
@@ -372,7 +610,7 @@ if uploaded_file is not None:
             for column in columns_to_clean:
                 comparison_columns.extend([column, f"{column}{add_suffix}"])
             
-            st.dataframe(df[comparison_columns].head(10), use_container_width=True)
+            st.dataframe(df.head(10)[comparison_columns], use_container_width=True)
             
             # Export options
             st.subheader("📥 Export Options")
@@ -381,7 +619,7 @@ if uploaded_file is not None:
             
             with col1:
                 # Full dataset download
-                full_csv = df.to_csv(index=False).encode('utf-8')
+                full_csv = dataframe_to_csv_bytes(df)
                 st.download_button(
                     label="📥 Download Complete Dataset",
                     data=full_csv,
@@ -389,6 +627,14 @@ if uploaded_file is not None:
                     mime="text/csv",
                     help="Download the full dataset with both original and cleaned columns"
                 )
+                full_parquet = dataframe_to_parquet_bytes(df)
+                st.download_button(
+                    label="📦 Download Complete Dataset (Parquet)",
+                    data=full_parquet,
+                    file_name=f"cleaned_blog_data_{int(time.time())}.parquet",
+                    mime="application/vnd.apache.parquet",
+                    help="Smaller, faster to write Parquet file with both original and cleaned columns"
+                )
             
             with col2:
                 # Cleaned columns only
@@ -400,7 +646,8 @@ if uploaded_file is not None:
                 else:
                     cleaned_df = df
                 
-                cleaned_csv = cleaned_df.to_csv(index=False).encode('utf-8')
+                # Reuse the full export when nothing was dropped
+                cleaned_csv = full_csv if cleaned_df is df else dataframe_to_csv_bytes(cleaned_df)
                 st.download_button(
                     label="📥 Download Cleaned Data Only",
                     data=cleaned_csv,
@@ -408,6 +655,14 @@ if uploaded_file is not None:
                     mime="text/csv",
                     help="Download only the processed data"
                 )
+                cleaned_parquet = full_parquet if cleaned_df is df else dataframe_to_parquet_bytes(cleaned_df)
+                st.download_button(
+                    label="📦 Download Cleaned Data Only (Parquet)",
+                    data=cleaned_parquet,
+                    file_name=f"cleaned_only_blog_data_{int(time.time())}.parquet",
+                    mime="application/vnd.apache.parquet",
+                    help="Download only the processed data as Parquet"
+                )
             
             # Success message
             st.success("🎉 Blog data cleaning completed successfully!")
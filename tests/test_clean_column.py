@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import app
+
+
+def test_email_removal_matches_between_object_and_arrow_columns():
+    values = ["éme@ex.com.", "contact: me@ex.com, <b>now</b>", "naïvejoe@site.org", None, ""]
+    options = {'decode_html': True, 'remove_tags': True, 'remove_email': True}
+
+    from_object = app.clean_column(pd.Series(values, dtype=object), options)
+    from_arrow = app.clean_column(pd.Series(values, dtype=pd.ArrowDtype(pa.string())), options)
+
+    assert from_arrow.tolist() == from_object.tolist()
+    assert from_object.tolist()[0] == "éme@ex.com."
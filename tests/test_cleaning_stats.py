@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import app
+
+
+def test_average_lengths_count_missing_values_as_empty():
+    original = pd.Series(["<b>abcd</b>", None], dtype=pd.ArrowDtype(pa.string()))
+    cleaned = app.clean_column(original, {'remove_tags': True})
+
+    stats = app.get_cleaning_stats(original, cleaned)
+
+    assert stats['avg_length_original'] == 5.5
+    assert stats['avg_length_cleaned'] == 2.0
+    assert stats['size_reduction'] == (5.5 - 2.0) / 5.5 * 100
@@ -0,0 +1,39 @@
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import app
+
+
+def read_with_c_engine(content: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(content), dtype=pd.ArrowDtype(pa.string()))
+
+
+def test_multiline_fields_across_arrow_blocks():
+    cell = '"' + 'first line, with a comma\nsecond line with ""quotes""\n' * 3 + '"'
+    content = ("id,body\n" + "".join(f"{i},{cell}\n" for i in range(20000))).encode()
+    assert len(content) > 1024 * 1024
+
+    df = app.read_csv_arrow(content)
+
+    assert df is not None
+    pd.testing.assert_frame_equal(df, read_with_c_engine(content))
+
+
+def test_values_and_headers_kept_as_text():
+    content = b"a,,a,post_date\n0x1A,+5,123456789012345678901234,2024-01-01\nNA,,x,\n"
+
+    df = app.read_csv_arrow(content)
+
+    assert list(df.columns) == ["a", "Unnamed: 1", "a.1", "post_date"]
+    assert df.iloc[0].tolist() == ["0x1A", "+5", "123456789012345678901234", "2024-01-01"]
+    pd.testing.assert_frame_equal(df, read_with_c_engine(content))
+
+
+def test_ragged_rows_fall_back_to_c_engine():
+    assert app.read_csv_arrow(b"a,b\n1,2\n3\n") is None